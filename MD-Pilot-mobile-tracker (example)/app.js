@@ -1,4 +1,14 @@
 // Mobile Fitness App - Kinobody Greek God Program
+
+// Shared date formatters (toLocaleDateString builds a new formatter on every call)
+const CURRENT_DATE_FORMAT = new Intl.DateTimeFormat('en-US', { weekday: 'long', month: 'long', day: 'numeric' });
+const CHART_DATE_FORMAT = new Intl.DateTimeFormat();
+
+// Today's UTC date (YYYY-MM-DD), used as the day key for meals and measurements
+function todayISODate() {
+    return new Date().toISOString().split('T')[0];
+}
+
 class KinobodyApp {
     constructor() {
         this.appState = {
@@ -194,9 +204,7 @@ class KinobodyApp {
     }
 
     updateCurrentDate() {
-        const today = new Date();
-        const options = { weekday: 'long', month: 'long', day: 'numeric' };
-        const dateString = today.toLocaleDateString('en-US', options);
+        const dateString = CURRENT_DATE_FORMAT.format(new Date());
         const element = document.getElementById('current-date');
         if (element) {
             element.textContent = dateString;
@@ -532,7 +540,7 @@ class KinobodyApp {
     addMeal(meal) {
         const mealEntry = {
             id: Date.now(),
-            date: new Date().toISOString().split('T')[0],
+            date: todayISODate(),
             ...meal
         };
 
@@ -553,7 +561,7 @@ class KinobodyApp {
         const mealsList = document.getElementById('meals-list');
         if (!mealsList) return;
         
-        const today = new Date().toISOString().split('T')[0];
+        const today = todayISODate();
         const todayMeals = this.appState.meals.filter(meal => meal.date === today);
 
         if (todayMeals.length === 0) {
@@ -585,7 +593,7 @@ class KinobodyApp {
     }
 
     updateMacroProgress() {
-        const today = new Date().toISOString().split('T')[0];
+        const today = todayISODate();
         const todayMeals = this.appState.meals.filter(meal => meal.date === today);
         
         const consumed = todayMeals.reduce((totals, meal) => ({
@@ -736,7 +744,7 @@ class KinobodyApp {
         
         if (weight) {
             const measurement = {
-                date: new Date().toISOString().split('T')[0],
+                date: todayISODate(),
                 weight: weight
             };
             
@@ -760,7 +768,7 @@ class KinobodyApp {
         
         if (waist || chest || arms) {
             const measurement = {
-                date: new Date().toISOString().split('T')[0],
+                date: todayISODate(),
                 waist: waist || null,
                 chest: chest || null,
                 arms: arms || null
@@ -811,7 +819,7 @@ class KinobodyApp {
         this.weightChart = new Chart(ctx, {
             type: 'line',
             data: {
-                labels: sampleData.map(d => new Date(d.date).toLocaleDateString()),
+                labels: sampleData.map(d => CHART_DATE_FORMAT.format(new Date(d.date))),
                 datasets: [{
                     label: 'Weight (kg)',
                     data: sampleData.map(d => d.weight),
@@ -852,7 +860,7 @@ class KinobodyApp {
         this.strengthChart = new Chart(ctx, {
             type: 'line',
             data: {
-                labels: sampleData.map(d => new Date(d.date).toLocaleDateString()),
+                labels: sampleData.map(d => CHART_DATE_FORMAT.format(new Date(d.date))),
                 datasets: [{
                     label: 'Incline Bench (kg)',
                     data: sampleData.map(d => d.weight),
@@ -903,7 +911,7 @@ class KinobodyApp {
                 .sort((a, b) => new Date(a.date) - new Date(b.date));
             
             this.weightChart.data.labels = weightMeasurements.map(m => 
-                new Date(m.date).toLocaleDateString()
+                CHART_DATE_FORMAT.format(new Date(m.date))
             );
             this.weightChart.data.datasets[0].data = weightMeasurements.map(m => m.weight);
             this.weightChart.update();